@@ -1,21 +1,18 @@
 import functools
 
 import pandas as pd
-from dask.dataframe.categorical import (
-    _categorize_block,
-    _get_categories,
-    _get_categories_agg,
-)
+from dask.dataframe.categorical import _get_categories, _get_categories_agg
+from dask.dataframe.dispatch import categorical_dtype, is_categorical_dtype
 from dask.dataframe.utils import (
     AttributeNotImplementedError,
     clear_known_categories,
     has_known_categories,
 )
-from dask.utils import M
 
 from dask_expr._accessor import Accessor, PropertyMap
 from dask_expr._expr import Blockwise, Elemwise, Projection
 from dask_expr._reductions import ApplyConcatApply
+from dask_expr._util import _identity
 
 
 class CategoricalAccessor(Accessor):
@@ -75,11 +72,7 @@ class CategoricalAccessor(Accessor):
             return self._series
         from dask_expr._collection import new_collection
 
-        categories = (
-            new_collection(PropertyMap(self._series, "cat", "categories"))
-            .unique()
-            .compute()
-        )
+        categories = new_collection(KnownCategories(self._series)).compute(**kwargs)
         return self.set_categories(categories.values)
 
     def as_unknown(self):
@@ -156,13 +149,44 @@ class CategoricalAccessor(Accessor):
 
 class AsUnknown(Elemwise):
     _parameters = ["frame"]
-    operation = M.copy
+    # Only the metadata changes, partitions can be passed through as-is
+    operation = staticmethod(_identity)
 
     @functools.cached_property
     def _meta(self):
         return clear_known_categories(self.frame._meta)
 
 
+def _categorize_block(df, categories, index):
+    """Categorize a dataframe with given categories
+
+    Mirrors ``dask.dataframe.categorical._categorize_block``, but only takes a
+    shallow copy of the partition. Every converted column is replaced rather
+    than modified in place, so copying the underlying data is not necessary.
+
+    df: DataFrame
+    categories: dict mapping column name to iterable of categories
+    """
+    df = df.copy(deep=False)
+    for col, vals in categories.items():
+        if is_categorical_dtype(df[col]):
+            df[col] = df[col].cat.set_categories(vals)
+        else:
+            cat_dtype = categorical_dtype(meta=df[col], categories=vals, ordered=False)
+            df[col] = df[col].astype(cat_dtype)
+    if index is not None:
+        if is_categorical_dtype(df.index):
+            ind = df.index.set_categories(index)
+        else:
+            cat_dtype = categorical_dtype(
+                meta=df.index, categories=index, ordered=False
+            )
+            ind = df.index.astype(dtype=cat_dtype)
+        ind.name = df.index.name
+        df.index = ind
+    return df
+
+
 class Categorize(Blockwise):
     _parameters = ["frame", "categories", "index"]
     operation = staticmethod(_categorize_block)
@@ -180,6 +204,9 @@ class GetCategories(ApplyConcatApply):
     _parameters = ["frame", "columns", "index", "split_every"]
 
     chunk = staticmethod(_get_categories)
+    # Merging category dicts is associative, so intermediate results are
+    # deduplicated at every level of the reduction tree
+    combine = staticmethod(_get_categories_agg)
     aggregate = staticmethod(_get_categories_agg)
 
     @property
@@ -200,3 +227,20 @@ class GetCategories(ApplyConcatApply):
             index=self.operand("index"),
             split_every=self.operand("split_every"),
         )
+
+
+def _get_known_categories(x):
+    return getattr(x, "cat", x).categories
+
+
+def _known_categories_agg(parts):
+    return parts[0].append(list(parts[1:])).drop_duplicates()
+
+
+class KnownCategories(ApplyConcatApply):
+    """Union of the categories found in every partition"""
+
+    _parameters = ["frame"]
+
+    chunk = staticmethod(_get_known_categories)
+    aggregate = staticmethod(_known_categories_agg)
@@ -142,10 +142,7 @@ from dask_expr.io import FromPandasDivisions, FromScalars
 def _wrap_expr_api(*args, wrap_api=None, **kwargs):
     # Use Expr API, but convert to/from Expr objects
     assert wrap_api is not None
-    result = wrap_api(
-        *[arg.expr if isinstance(arg, FrameBase) else arg for arg in args],
-        **kwargs,
-    )
+    result = wrap_api(*[_unwrap(arg) for arg in args], **kwargs)
     if isinstance(result, expr.Expr):
         return new_collection(result)
     return result
@@ -154,9 +151,8 @@ def _wrap_expr_api(*args, wrap_api=None, **kwargs):
 def _wrap_expr_op(self, other, op=None):
     # Wrap expr operator
     assert op is not None
-    if isinstance(other, FrameBase):
-        other = other.expr
-    elif isinstance(other, da.Array):
+    other = _unwrap(other)
+    if isinstance(other, da.Array):
         other = from_dask_array(
             other, index=self.index.to_legacy_dataframe(), columns=self.columns
         )
@@ -178,6 +174,15 @@ def _wrap_expr_op(self, other, op=None):
         return new_collection(expr.OpAlignPartitions(self, other, op))
 
 
+def _make_expr_op_method(wrapper, op):
+    # Plain functions are cheaper to call than ``functools.partialmethod``
+    def method(self, *args):
+        return wrapper(self, *args, op=op)
+
+    method.__name__ = method.__qualname__ = op
+    return method
+
+
 def _wrap_expr_method_operator(name, class_):
     """
     Add method operators to Series or DataFrame like DataFrame.add.
@@ -292,6 +297,9 @@ class FrameBase(DaskMethodsMixin):
         named_schedulers.get("threads", named_schedulers["sync"])
     )
     __dask_optimize__ = staticmethod(lambda dsk, keys, **kwargs: dsk)
+    # Lowered expression shared by the dask protocol methods. Only set on
+    # the private collection of a single ``compute``/``persist`` call
+    _lowered = None
 
     def __init__(self, expr):
         global _WARN_ANNOTATIONS
@@ -388,6 +396,9 @@ class FrameBase(DaskMethodsMixin):
         return new_collection, (self._expr,)
 
     def __getitem__(self, other):
+        if type(other) is str:
+            # Fast path for the most common case, ``df["a"]``
+            return new_collection(expr.Projection(self.expr, other))
         if isinstance(other, FrameBase):
             return new_collection(self.expr.__getitem__(other.expr))
         elif isinstance(other, slice):
@@ -443,6 +454,7 @@ Expr={expr}"""
 
     def persist(self, fuse=True, **kwargs):
         out = self.optimize(fuse=fuse)
+        out._lowered = out.expr.lower_completely()
         return DaskMethodsMixin.persist(out, **kwargs)
 
     def compute(self, fuse=True, **kwargs):
@@ -450,6 +462,9 @@ Expr={expr}"""
         if not isinstance(out, Scalar):
             out = out.repartition(npartitions=1)
         out = out.optimize(fuse=fuse)
+        # ``out`` is private to this call, so the graph, keys and
+        # postcompute can share one lowering
+        out._lowered = out.expr.lower_completely()
         return DaskMethodsMixin.compute(out, **kwargs)
 
     def analyze(self, filename: str | None = None, format: str | None = None) -> None:
@@ -468,15 +483,18 @@ Expr={expr}"""
     def dask(self):
         return self.__dask_graph__()
 
+    def _lower_completely(self) -> expr.Expr:
+        # Lowering depends on config and runtime state (e.g. the shuffle
+        # method), so it is only reused within a single compute/persist
+        if self._lowered is not None:
+            return self._lowered
+        return self._expr.lower_completely()
+
     def __dask_graph__(self):
-        out = self.expr
-        out = out.lower_completely()
-        return out.__dask_graph__()
+        return self._lower_completely().__dask_graph__()
 
     def __dask_keys__(self):
-        out = self.expr
-        out = out.lower_completely()
-        return out.__dask_keys__()
+        return self._lower_completely().__dask_keys__()
 
     def simplify(self):
         return new_collection(self.expr.simplify())
@@ -492,13 +510,13 @@ Expr={expr}"""
         return self.__dask_graph__()
 
     def __dask_postcompute__(self):
-        state = new_collection(self.expr.lower_completely())
+        state = new_collection(self._lower_completely())
         if type(self) != type(state):
             return state.__dask_postcompute__()
         return _concat, ()
 
     def __dask_postpersist__(self):
-        state = new_collection(self.expr.lower_completely())
+        state = new_collection(self._lower_completely())
         return from_graph, (
             state._meta,
             state.divisions,
@@ -507,20 +525,17 @@ Expr={expr}"""
         )
 
     def __getattr__(self, key):
+        # Only called if the regular (`FrameBase`) attribute lookup failed
         try:
-            # Prioritize `FrameBase` attributes
+            # Fall back to `expr` API
+            # (Making sure to convert to/from Expr)
+            val = getattr(self.expr, key)
+        except AttributeError:
+            # Raise original error
             return object.__getattribute__(self, key)
-        except AttributeError as err:
-            try:
-                # Fall back to `expr` API
-                # (Making sure to convert to/from Expr)
-                val = getattr(self.expr, key)
-                if callable(val):
-                    return functools.partial(_wrap_expr_api, wrap_api=val)
-                return val
-            except AttributeError:
-                # Raise original error
-                raise err
+        if callable(val):
+            return functools.partial(_wrap_expr_api, wrap_api=val)
+        return val
 
     def visualize(self, tasks: bool = False, **kwargs):
         """Visualize the expression or task graph
@@ -672,13 +687,20 @@ Expr={expr}"""
     def _partitions(self, index):
         # Used by `partitions` for partition-wise slicing
 
-        # Convert index to list
+        # Convert index to list. Integers and slices are resolved on a
+        # ``range`` to avoid materializing all partition numbers
+        partitions = range(self.npartitions)
         if isinstance(index, int):
-            index = [index]
-        index = np.arange(self.npartitions, dtype=object)[index].tolist()
+            index = [partitions[index]]
+        elif isinstance(index, slice):
+            index = list(partitions[index])
+        elif isinstance(index, list) and all(type(i) is int for i in index):
+            index = [partitions[i] for i in index]
+        else:
+            index = np.arange(self.npartitions, dtype=object)[index].tolist()
 
-        # Check that selection makes sense
-        assert set(index).issubset(range(self.npartitions))
+            # Check that selection makes sense
+            assert all(i in partitions for i in index)
 
         # Return selected partitions
         return new_collection(expr.Partitions(self, index))
@@ -1835,16 +1857,16 @@ Expr={expr}"""
     def where(self, cond, other=np.nan):
         cond = self._create_alignable_frame(cond)
         other = self._create_alignable_frame(other)
-        cond = cond.expr if isinstance(cond, FrameBase) else cond
-        other = other.expr if isinstance(other, FrameBase) else other
+        cond = _unwrap(cond)
+        other = _unwrap(other)
         return new_collection(self.expr.where(cond, other))
 
     @derived_from(pd.DataFrame)
     def mask(self, cond, other=np.nan):
         cond = self._create_alignable_frame(cond)
         other = self._create_alignable_frame(other)
-        cond = cond.expr if isinstance(cond, FrameBase) else cond
-        other = other.expr if isinstance(other, FrameBase) else other
+        cond = _unwrap(cond)
+        other = _unwrap(other)
         return new_collection(self.expr.mask(cond, other))
 
     @derived_from(pd.DataFrame)
@@ -2507,14 +2529,14 @@ for op in [
     "__xor__",
     "__rxor__",
 ]:
-    setattr(FrameBase, op, functools.partialmethod(_wrap_expr_op, op=op))
+    setattr(FrameBase, op, _make_expr_op_method(_wrap_expr_op, op))
 
 for op in [
     "__invert__",
     "__neg__",
     "__pos__",
 ]:
-    setattr(FrameBase, op, functools.partialmethod(_wrap_unary_expr_op, op=op))
+    setattr(FrameBase, op, _make_expr_op_method(_wrap_unary_expr_op, op))
 
 
 class DataFrame(FrameBase):
@@ -2890,24 +2912,20 @@ class DataFrame(FrameBase):
         self._expr = out._expr
 
     def __delitem__(self, key):
-        columns = [c for c in self.columns if c != key]
-        out = self[columns]
-        self._expr = out._expr
+        columns = [c for c in self.expr._meta.columns if c != key]
+        self._expr = expr.Projection(self.expr, columns)
 
     def __getattr__(self, key):
+        # Only called if the regular (`DataFrame`) attribute lookup failed
         try:
-            # Prioritize `DataFrame` attributes
-            return object.__getattribute__(self, key)
-        except AttributeError as err:
-            try:
-                # Check if key is in columns if key
-                # is not a normal attribute
-                if key in self.expr._meta.columns:
-                    return new_collection(self.expr[key])
-                raise err
-            except AttributeError:
-                # Fall back to `BaseFrame.__getattr__`
-                return super().__getattr__(key)
+            # Check if key is in columns if key
+            # is not a normal attribute
+            if key in self.expr._meta.columns:
+                return new_collection(self.expr[key])
+        except AttributeError:
+            pass
+        # Fall back to `BaseFrame.__getattr__`
+        return super().__getattr__(key)
 
     def __dir__(self):
         o = set(dir(type(self)))
@@ -4597,11 +4615,33 @@ class Scalar(FrameBase):
         return self._meta.dtype
 
 
+_FRAME_TYPES = {DataFrame, Series, Index, Scalar}
+
+
+def _unwrap(obj):
+    """Return the expression of a collection, other objects are passed through"""
+    # Exact type check first, this covers almost all collections
+    if type(obj) in _FRAME_TYPES or isinstance(obj, FrameBase):
+        return obj.expr
+    return obj
+
+
+# Exact-type fast path for pandas meta, avoids going through the dispatcher
+_pandas_collection_types = {
+    pd.DataFrame: DataFrame,
+    pd.Series: Series,
+    pd.Index: Index,
+}
+
+
 def new_collection(expr):
     """Create new collection from an expr"""
     meta = expr._meta
     expr._name  # Ensure backend is imported
-    return get_collection_type(meta)(expr)
+    collection_type = _pandas_collection_types.get(type(meta))
+    if collection_type is None:
+        collection_type = get_collection_type(meta)
+    return collection_type(expr)
 
 
 def optimize(collection, fuse=True):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import inspect
 import os
 import weakref
 from collections import defaultdict
@@ -9,7 +10,6 @@ from typing import TYPE_CHECKING, Literal
 
 import dask
 import pandas as pd
-import toolz
 from dask.dataframe.core import is_dataframe_like, is_index_like, is_series_like
 from dask.utils import funcname, import_required, is_arraylike
 
@@ -39,10 +39,70 @@ def _unpack_collections(o):
         return o
 
 
+_no_attribute = object()
+
+
+class _OperandAttribute:
+    """Class-level accessor for the operand of a parameter
+
+    Installed for every parameter that is not already reserved by a
+    method/property, so that ``expr.frame`` is a plain descriptor lookup
+    instead of a failed attribute lookup followed by ``Expr.__getattr__``.
+    """
+
+    def __init__(self, index):
+        self.index = index
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.operands[self.index]
+
+
+class _NoOperandAttribute:
+    """Hides an inherited operand accessor for a parameter that was dropped"""
+
+    def __get__(self, instance, owner=None):
+        raise AttributeError
+
+
 class Expr:
     _parameters = []
     _defaults = {}
     _instances = weakref.WeakValueDictionary()
+    # Position of every parameter in ``operands``, set for each subclass
+    _parameter_index: dict = {}
+    # Prefix of ``_name``, set for each subclass that doesn't define its own
+    _funcname = "expr"
+    _funcname_is_generated = True
+    # Class name shown in the tree representation, set for each subclass
+    _typename = "Expr"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_funcname" in vars(cls):
+            cls._funcname_is_generated = False
+        elif cls._funcname_is_generated:
+            cls._funcname = funcname(cls).lower()
+        cls._typename = funcname(cls)
+        cls._parameter_index = {
+            parameter: i for i, parameter in enumerate(cls._parameters)
+        }
+        # Operand accessors of the parents are only valid if the parameter
+        # has the same position in this class
+        for base in cls.__mro__[1:]:
+            for name in getattr(base, "_parameter_index", ()):
+                attr = inspect.getattr_static(cls, name, None)
+                if isinstance(attr, _OperandAttribute) and (
+                    cls._parameter_index.get(name) != attr.index
+                ):
+                    setattr(cls, name, _NoOperandAttribute())
+        for parameter, i in cls._parameter_index.items():
+            attr = inspect.getattr_static(cls, parameter, _no_attribute)
+            if attr is _no_attribute or isinstance(
+                attr, (_OperandAttribute, _NoOperandAttribute)
+            ):
+                setattr(cls, parameter, _OperandAttribute(i))
 
     def __new__(cls, *args, **kwargs):
         operands = list(args)
@@ -100,7 +160,7 @@ class Expr:
         return header
 
     def _tree_repr_lines(self, indent=0, recursive=True):
-        header = funcname(type(self)) + ":"
+        header = self._typename + ":"
         lines = []
         for i, op in enumerate(self.operands):
             if isinstance(op, Expr):
@@ -155,26 +215,45 @@ class Expr:
             raise RuntimeError(f"Serializing a {type(self)} object")
         return type(self), tuple(self.operands)
 
-    def _depth(self):
+    def _depth(self, cache=None):
         """Depth of the expression tree
 
+        Parameters
+        ----------
+        cache: dict, optional
+            Depths of already visited expressions, keyed by name. Pass the
+            same dict to compute the depth of several expressions that
+            share sub-expressions.
+
         Returns
         -------
         depth: int
         """
-        if not self.dependencies():
-            return 1
+        if cache is None:
+            cache = {}
+        if self._name in cache:
+            return cache[self._name]
+        dependencies = self.dependencies()
+        if not dependencies:
+            depth = 1
         else:
-            return max(expr._depth() for expr in self.dependencies()) + 1
+            depth = max(expr._depth(cache) for expr in dependencies) + 1
+        cache[self._name] = depth
+        return depth
 
     def operand(self, key):
         # Access an operand unambiguously
         # (e.g. if the key is reserved by a method/property)
-        return self.operands[type(self)._parameters.index(key)]
+        return self.operands[type(self)._parameter_index[key]]
 
-    def dependencies(self):
+    @functools.cached_property
+    def _dependencies(self) -> tuple:
         # Dependencies are `Expr` operands only
-        return [operand for operand in self.operands if isinstance(operand, Expr)]
+        return tuple(operand for operand in self.operands if isinstance(operand, Expr))
+
+    def dependencies(self):
+        # Return a new list, callers are free to mutate it
+        return list(self._dependencies)
 
     def _task(self, index: int):
         """The task for the i'th partition
@@ -229,12 +308,20 @@ class Expr:
 
         return {(self._name, i): self._task(i) for i in range(self.npartitions)}
 
-    def rewrite(self, kind: str):
+    def rewrite(self, kind: str, rewritten: dict | None = None):
         """Rewrite an expression
 
         This leverages the ``._{kind}_down`` and ``._{kind}_up``
         methods defined on each class
 
+        Parameters
+        ----------
+        kind: str
+            The kind of rewrite, e.g. ``"tune"``
+        rewritten: dict, optional
+            Cache of already rewritten expressions, keyed by name. Shared
+            sub-expressions are only rewritten once.
+
         Returns
         -------
         expr:
@@ -242,6 +329,11 @@ class Expr:
         changed:
             whether or not any change occured
         """
+        if rewritten is None:
+            rewritten = {}
+        if self._name in rewritten:
+            return rewritten[self._name]
+
         expr = self
         down_name = f"_{kind}_down"
         up_name = f"_{kind}_up"
@@ -253,6 +345,7 @@ class Expr:
             if out is None:
                 out = expr
             if not isinstance(out, Expr):
+                rewritten[self._name] = out
                 return out
             if out._name != expr._name:
                 expr = out
@@ -264,6 +357,7 @@ class Expr:
                 if out is None:
                     out = expr
                 if not isinstance(out, Expr):
+                    rewritten[self._name] = out
                     return out
                 if out is not expr and out._name != expr._name:
                     expr = out
@@ -278,7 +372,7 @@ class Expr:
             changed = False
             for operand in expr.operands:
                 if isinstance(operand, Expr):
-                    new = operand.rewrite(kind=kind)
+                    new = operand.rewrite(kind=kind, rewritten=rewritten)
                     if new._name != operand._name:
                         changed = True
                 else:
@@ -291,6 +385,7 @@ class Expr:
             else:
                 break
 
+        rewritten[self._name] = expr
         return expr
 
     def simplify_once(self, dependents: defaultdict, simplified: dict):
@@ -386,7 +481,20 @@ class Expr:
     def _simplify_up(self, parent, dependents):
         return
 
-    def lower_once(self):
+    def lower_once(self, lowered: dict | None = None):
+        """Lower this expression and all of its children once
+
+        Parameters
+        ----------
+        lowered: dict, optional
+            Cache of already lowered expressions, keyed by name. Shared
+            sub-expressions are only lowered once.
+        """
+        if lowered is None:
+            lowered = {}
+        if self._name in lowered:
+            return lowered[self._name]
+
         expr = self
 
         # Lower this node
@@ -394,6 +502,7 @@ class Expr:
         if out is None:
             out = expr
         if not isinstance(out, Expr):
+            lowered[self._name] = out
             return out
 
         # Lower all children
@@ -401,7 +510,7 @@ class Expr:
         changed = False
         for operand in out.operands:
             if isinstance(operand, Expr):
-                new = operand.lower_once()
+                new = operand.lower_once(lowered)
                 if new._name != operand._name:
                     changed = True
             else:
@@ -411,6 +520,7 @@ class Expr:
         if changed:
             out = type(out)(*new_operands)
 
+        lowered[self._name] = out
         return out
 
     def lower_completely(self) -> Expr:
@@ -442,10 +552,6 @@ class Expr:
     def _lower(self):
         return
 
-    @functools.cached_property
-    def _funcname(self):
-        return funcname(type(self)).lower()
-
     @functools.cached_property
     def _name(self):
         return self._funcname + "-" + _tokenize_deterministic(*self.operands)
@@ -469,10 +575,9 @@ class Expr:
             # Allow operands to be accessed as attributes
             # as long as the keys are not already reserved
             # by existing methods/properties
-            _parameters = type(self)._parameters
-            if key in _parameters:
-                idx = _parameters.index(key)
-                return self.operands[idx]
+            _parameter_index = type(self)._parameter_index
+            if key in _parameter_index:
+                return self.operands[_parameter_index[key]]
             if is_dataframe_like(self._meta) and key in self._meta.columns:
                 return self[key]
 
@@ -487,7 +592,7 @@ class Expr:
         """Traverse expression tree, collect layers"""
         stack = [self]
         seen = set()
-        layers = []
+        graph = {}
         while stack:
             expr = stack.pop()
 
@@ -495,11 +600,10 @@ class Expr:
                 continue
             seen.add(expr._name)
 
-            layers.append(expr._layer())
-            for operand in expr.dependencies():
-                stack.append(operand)
+            graph.update(expr._layer())
+            stack.extend(expr.dependencies())
 
-        return toolz.merge(layers)
+        return graph
 
     @property
     def dask(self):
@@ -524,11 +628,13 @@ class Expr:
         >>> (df + 10).substitute(10, 20)
         df + 20
         """
-        return self._substitute(old, new, _seen=set())
+        return self._substitute(old, new, _seen={})
 
     def _substitute(self, old, new, _seen):
+        # ``_seen`` maps the names of visited sub-expressions to their
+        # result, so that shared sub-expressions are only rewritten once
         if self._name in _seen:
-            return self
+            return _seen[self._name]
         # Check if we are replacing a literal
         if isinstance(old, Expr):
             substitute_literal = False
@@ -574,10 +680,11 @@ class Expr:
                 new_exprs.append(operand)
 
         if update:  # Only recreate if something changed
-            return type(self)(*new_exprs)
+            result = type(self)(*new_exprs)
         else:
-            _seen.add(self._name)
-        return self
+            result = self
+        _seen[self._name] = result
+        return result
 
     def substitute_parameters(self, substitutions: dict) -> Expr:
         """Substitute specific `Expr` parameters
@@ -592,13 +699,12 @@ class Expr:
             return self
 
         changed = False
-        new_operands = []
-        for i, operand in enumerate(self.operands):
-            if i < len(self._parameters) and self._parameters[i] in substitutions:
-                new_operands.append(substitutions[self._parameters[i]])
+        new_operands = list(self.operands)
+        _parameter_index = type(self)._parameter_index
+        for key, value in substitutions.items():
+            if key in _parameter_index:
+                new_operands[_parameter_index[key]] = value
                 changed = True
-            else:
-                new_operands.append(operand)
         if changed:
             return type(self)(*new_operands)
         return self
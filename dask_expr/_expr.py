@@ -390,9 +390,8 @@ class Expr(core.Expr):
 
     @property
     def npartitions(self):
-        if "npartitions" in self._parameters:
-            idx = self._parameters.index("npartitions")
-            return self.operands[idx]
+        if "npartitions" in self._parameter_index:
+            return self.operands[self._parameter_index["npartitions"]]
         else:
             return len(self.divisions) - 1
 
@@ -502,17 +501,28 @@ class Blockwise(Expr):
         if self.operation:
             head = funcname(self.operation)
         else:
-            head = funcname(type(self)).lower()
+            head = self._funcname
         return head + "-" + _tokenize_deterministic(*self.operands)
 
+    @functools.cached_property
+    def _broadcast_deps(self) -> dict:
+        # Result of ``_broadcast_dep`` for every dependency, filled in
+        # on first use so that tasks don't recompute it per partition
+        return {}
+
     def _blockwise_arg(self, arg, i):
         """Return a Blockwise-task argument"""
         if isinstance(arg, Expr):
             # Make key for Expr-based argument
-            if self._broadcast_dep(arg):
-                return (arg._name, 0)
+            name = arg._name
+            try:
+                broadcast = self._broadcast_deps[name]
+            except KeyError:
+                broadcast = self._broadcast_deps[name] = self._broadcast_dep(arg)
+            if broadcast:
+                return (name, 0)
             else:
-                return (arg._name, i)
+                return (name, i)
 
         else:
             return arg
@@ -2987,10 +2997,16 @@ def optimize_blockwise_fusion(expr):
             if v == set()
             or all(not is_valid_blockwise_op(expr_mapping[_expr]) for _expr in v)
         ]
+        root_names = {r._name for r in roots}
         while roots:
             root = roots.pop()
+            root_names.discard(root._name)
             seen = set()
             stack = [root]
+            # Names that are either in the local group or on the
+            # local stack. Everything pushed onto the stack ends
+            # up in the group, so this set only ever grows.
+            local_names = {root._name}
             group = []
             while stack:
                 next = stack.pop()
@@ -3003,11 +3019,9 @@ def optimize_blockwise_fusion(expr):
                 for dep_name in dependencies[next._name]:
                     dep = expr_mapping[dep_name]
 
-                    stack_names = {s._name for s in stack}
-                    group_names = {g._name for g in group}
                     if (
                         dep.npartitions == root.npartitions or next._broadcast_dep(dep)
-                    ) and not (dependents[dep._name] - stack_names - group_names):
+                    ) and not (dependents[dep._name] - local_names):
                         # All of deps dependents are contained
                         # in the local group (or the local stack
                         # of expr nodes that we know we will be
@@ -3016,23 +3030,24 @@ def optimize_blockwise_fusion(expr):
                         # of partitions, since broadcasting within
                         # a group is not allowed.
                         stack.append(dep)
-                    elif dependencies[dep._name] and dep._name not in [
-                        r._name for r in roots
-                    ]:
+                        local_names.add(dep._name)
+                    elif dependencies[dep._name] and dep._name not in root_names:
                         # Couldn't fuse dep, but we may be able to
                         # use it as a new root on the next pass
                         roots.append(dep)
+                        root_names.add(dep._name)
 
             # Replace fusable sub-group
             if len(group) > 1:
-                group_deps = []
-                local_names = [_expr._name for _expr in group]
+                # External dependencies, every one is passed to the
+                # fused task once, even if several members use it
+                group_deps = {}
+                local_names = {_expr._name for _expr in group}
                 for _expr in group:
-                    group_deps += [
-                        operand
-                        for operand in _expr.dependencies()
-                        if operand._name not in local_names
-                    ]
+                    for operand in _expr.dependencies():
+                        if operand._name not in local_names:
+                            group_deps.setdefault(operand._name, operand)
+                group_deps = list(group_deps.values())
                 _ret = expr.substitute(group[0], Fused(group, *group_deps))
                 return _ret, not roots
 
@@ -3522,7 +3537,8 @@ class Fused(Blockwise):
         return lines
 
     def __str__(self):
-        exprs = sorted(self.exprs, key=M._depth)
+        cache = {}
+        exprs = sorted(self.exprs, key=lambda expr: expr._depth(cache))
         names = [expr._name.split("-")[0] for expr in exprs]
         if len(names) > 4:
             return names[0] + "-fused-" + names[-1]
@@ -3547,21 +3563,21 @@ class Fused(Blockwise):
                 subgraph, name = _expr._task(index)[1:3]
                 graph.update(subgraph)
                 graph[(name, index)] = name
-            elif self._broadcast_dep(_expr):
+            else:
                 # When _expr is being broadcasted, we only
                 # want to define a fused task for index 0
-                graph[(_expr._name, 0)] = _expr._task(0)
-            else:
-                graph[(_expr._name, index)] = _expr._task(index)
+                key = self._blockwise_arg(_expr, index)
+                graph[key] = _expr._task(key[1])
 
-        for i, dep in enumerate(self.dependencies()):
-            graph[self._blockwise_arg(dep, index)] = "_" + str(i)
+        dep_keys = tuple(self._blockwise_arg(dep, index) for dep in self.dependencies())
+        for i, key in enumerate(dep_keys):
+            graph[key] = "_" + str(i)
 
         return (
             Fused._execute_task,
             graph,
             self._name,
-        ) + tuple(self._blockwise_arg(dep, index) for dep in self.dependencies())
+        ) + dep_keys
 
     @staticmethod
     def _execute_task(graph, name, *deps):
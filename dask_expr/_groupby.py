@@ -599,7 +599,7 @@ class Size(SingleAggregation):
         if set(by_columns) == set(self.frame.columns):
             return
 
-        slice_idx = self._parameters.index("_slice")
+        slice_idx = self._parameter_index["_slice"]
         ops = [op if i != slice_idx else None for i, op in enumerate(self.operands)]
         return type(self)(self.frame[by_columns], *ops[1:])
 
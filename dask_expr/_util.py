@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import datetime
 import functools
-from collections import OrderedDict, UserDict
+from collections import OrderedDict
 from collections.abc import Hashable, Sequence
-from typing import Any, Literal, TypeVar, cast
+from typing import Any, Literal, TypeVar
 
 import dask
 import numpy as np
@@ -51,8 +52,14 @@ def _calc_maybe_new_divisions(df, periods, freq):
             # (e.g. index_partitions = [[1, 2, 3], [3, 4, 5]])
             return None  # Would need to clear divisions
     if df.known_divisions:
-        divs = pd.Series(range(len(df.divisions)), index=df.divisions)
-        divisions = divs.shift(periods, freq=freq).index
+        if is_offset or isinstance(freq, (datetime.timedelta, np.timedelta64)):
+            # Fixed size frequency, shifting is plain index arithmetic
+            divisions = pd.Index(df.divisions) + periods * freq
+        elif freq is None:
+            # Only the values are shifted, the index is left unchanged
+            return df.divisions
+        else:
+            divisions = pd.Index(df.divisions).shift(periods, freq=freq)
         return tuple(divisions)
     return df.divisions
 
@@ -68,8 +75,29 @@ def _validate_axis(axis=0, none_is_zero: bool = True) -> None | Literal[0, 1]:
     return numeric_axis.get(axis, axis)
 
 
+def _identity(x):
+    return x
+
+
+def _to_singleton_list(x):
+    return [x]
+
+
+# Exact-type fast path for the most common inputs of ``_convert_to_list``
+_list_converters = {
+    list: _identity,
+    tuple: list,
+    type(None): _identity,
+    str: _to_singleton_list,
+    int: _to_singleton_list,
+}
+
+
 def _convert_to_list(column) -> list | None:
-    if column is None or isinstance(column, list):
+    converter = _list_converters.get(type(column))
+    if converter is not None:
+        return converter(column)
+    if isinstance(column, list):
         pass
     elif isinstance(column, tuple):
         column = list(column)
@@ -80,7 +108,17 @@ def _convert_to_list(column) -> list | None:
     return column
 
 
+_scalar_types = {int, float, str, bool, type(None)}
+_non_scalar_types = {list, tuple, dict}
+
+
 def is_scalar(x):
+    # Exact type checks first, these cover the vast majority of calls
+    typ = type(x)
+    if typ in _scalar_types:
+        return True
+    if typ in _non_scalar_types:
+        return False
     # np.isscalar does not work for some pandas scalars, for example pd.NA
     if isinstance(x, Sequence) and not isinstance(x, str):
         return False
@@ -91,9 +129,15 @@ def is_scalar(x):
     if isinstance(x, (str, int)) or x is None:
         return True
 
+    return not isinstance(x, _expr_type())
+
+
+@functools.lru_cache(maxsize=None)
+def _expr_type():
+    # Deferred to avoid a circular import with ``dask_expr._expr``
     from dask_expr._expr import Expr
 
-    return not isinstance(x, Expr)
+    return Expr
 
 
 def _tokenize_deterministic(*args, **kwargs) -> str:
@@ -106,32 +150,44 @@ def _tokenize_partial(expr, ignore: list | None = None) -> str:
     # Helper function to "tokenize" the operands
     # that are not in the `ignore` list
     ignore = ignore or []
-    return _tokenize_deterministic(
+    key = (expr._name, tuple(ignore))
+    if key in _partial_token_cache:
+        return _partial_token_cache[key]
+    token = _tokenize_deterministic(
         *[
             op
             for i, op in enumerate(expr.operands)
             if i >= len(expr._parameters) or expr._parameters[i] not in ignore
         ]
     )
+    _partial_token_cache[key] = token
+    return token
 
 
-class LRU(UserDict[K, V]):
+class LRU(OrderedDict[K, V]):
     """Limited size mapping, evicting the least recently looked-up key when full"""
 
     def __init__(self, maxsize: float) -> None:
         super().__init__()
-        self.data = OrderedDict()
         self.maxsize = maxsize
 
     def __getitem__(self, key: K) -> V:
-        value = super().__getitem__(key)
-        cast(OrderedDict, self.data).move_to_end(key)
+        value = OrderedDict.__getitem__(self, key)
+        self.move_to_end(key)
         return value
 
     def __setitem__(self, key: K, value: V) -> None:
-        if len(self) >= self.maxsize:
-            cast(OrderedDict, self.data).popitem(last=False)
-        super().__setitem__(key, value)
+        if key not in self and len(self) >= self.maxsize:
+            self.popitem(last=False)
+        OrderedDict.__setitem__(self, key, value)
+
+    def __reduce__(self):
+        return type(self), (self.maxsize,), None, None, iter(self.items())
+
+
+# Partial tokens keyed by ``(expr._name, ignore)``. Expressions are immutable,
+# so the full name uniquely determines the partial token as well.
+_partial_token_cache: LRU = LRU(4096)
 
 
 class _BackendData:
@@ -151,15 +207,24 @@ class _BackendData:
 
         return _tokenize_deterministic(self._data)
 
+    @functools.cached_property
+    def _index_is_monotonic_increasing(self):
+        return self._data.index.is_monotonic_increasing
+
+    @functools.cached_property
+    def _sorted(self):
+        # Shared by every expression wrapping this data
+        if self._index_is_monotonic_increasing:
+            return self
+        return _BackendData(self._data.sort_index())
+
     def __len__(self):
         return len(self._data)
 
     def __getattr__(self, key: str) -> Any:
-        try:
-            return object.__getattribute__(self, key)
-        except AttributeError:
-            # Return the underlying backend attribute
-            return getattr(self._data, key)
+        # Only called when regular attribute lookup fails,
+        # so return the underlying backend attribute
+        return getattr(self._data, key)
 
     def __reduce__(self):
         return type(self), (self._data,)
@@ -170,13 +235,16 @@ def normalize_data_wrapper(data):
     return data._token
 
 
+_pandas_types = (pd.Series, pd.DataFrame)
+
+
 def _maybe_from_pandas(dfs):
+    if not any(isinstance(df, _pandas_types) for df in dfs):
+        return list(dfs)
+
     from dask_expr import from_pandas
 
-    dfs = [
-        from_pandas(df, 1) if isinstance(df, (pd.Series, pd.DataFrame)) else df
-        for df in dfs
-    ]
+    dfs = [from_pandas(df, 1) if isinstance(df, _pandas_types) else df for df in dfs]
     return dfs
 
 
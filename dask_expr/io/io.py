@@ -78,9 +78,9 @@ class BlockwiseIO(Blockwise, IO):
             # Column projection
             parent_columns = parent.operand("columns")
             proposed_columns = determine_column_projection(self, parent, dependents)
-            proposed_columns = _convert_to_list(proposed_columns)
+            proposed_columns = set(_convert_to_list(proposed_columns))
             proposed_columns = [col for col in self.columns if col in proposed_columns]
-            if set(proposed_columns) == set(self.columns):
+            if len(proposed_columns) == len(self.columns):
                 # Already projected or nothing to do
                 return
             substitutions = {"columns": proposed_columns}
@@ -364,6 +364,28 @@ class FromMapProjectable(FromMap):
         return tsk
 
 
+def _unique_division_locations(index, npartitions=None, chunksize=None):
+    """Vectorized ``sorted_division_locations`` for a sorted, unique index
+
+    Without duplicates every partition boundary falls exactly on a multiple
+    of the chunk size, so the locations can be computed with NumPy instead
+    of stepping through the index in Python.
+    """
+    nrows = len(index)
+    if npartitions is not None:
+        chunksize, residual = divmod(nrows, npartitions)
+        if chunksize == 0:
+            locations = np.arange(nrows + 1)
+        else:
+            sizes = np.full(npartitions, chunksize)
+            sizes[:residual] += 1
+            locations = np.concatenate([[0], np.cumsum(sizes)])
+    else:
+        locations = np.append(np.arange(0, nrows, max(chunksize, 1)), nrows)
+    divisions = list(index[locations[:-1]]) + [index[-1]]
+    return divisions, locations.tolist()
+
+
 class FromPandas(PartitionsFiltered, BlockwiseIO):
     """The only way today to get a real dataframe"""
 
@@ -390,18 +412,17 @@ class FromPandas(PartitionsFiltered, BlockwiseIO):
 
     @functools.cached_property
     def frame(self):
-        frame = self.operand("frame")._data
-        if self.sort and not frame.index.is_monotonic_increasing:
-            frame = frame.sort_index()
-            return _BackendData(frame)
+        if self.sort:
+            return self.operand("frame")._sorted
         return self.operand("frame")
 
     @functools.cached_property
     def _meta(self):
+        data = self.frame._data
         if self.pyarrow_strings_enabled:
-            meta = make_meta(to_pyarrow_string(self.frame.head(1)))
+            meta = make_meta(to_pyarrow_string(data.iloc[:1]))
         else:
-            meta = self.frame.head(0)
+            meta = data.iloc[:0]
 
         if self.operand("columns") is not None:
             return meta[self.columns[0]] if self._series else meta[self.columns]
@@ -431,12 +452,19 @@ class FromPandas(PartitionsFiltered, BlockwiseIO):
             if nrows == 0:
                 locations = [0] * (npartitions + 1)
                 divisions = (None,) * len(locations)
-            elif sort or self.frame._data.index.is_monotonic_increasing:
-                divisions, locations = sorted_division_locations(
-                    data.index,
-                    npartitions=npartitions,
-                    chunksize=self.operand("chunksize"),
-                )
+            elif sort or self.frame._index_is_monotonic_increasing:
+                if data.index.is_unique:
+                    divisions, locations = _unique_division_locations(
+                        data.index,
+                        npartitions=npartitions,
+                        chunksize=self.operand("chunksize"),
+                    )
+                else:
+                    divisions, locations = sorted_division_locations(
+                        data.index,
+                        npartitions=npartitions,
+                        chunksize=self.operand("chunksize"),
+                    )
             else:
                 if npartitions is None:
                     chunksize = self.operand("chunksize")
@@ -449,12 +477,12 @@ class FromPandas(PartitionsFiltered, BlockwiseIO):
 
     def _get_lengths(self) -> tuple | None:
         if self._pd_length_stats is None:
-            locations = self._locations()
-            self._pd_length_stats = tuple(
-                offset - locations[i]
-                for i, offset in enumerate(locations[1:])
-                if not self._filtered or i in self._partitions
-            )
+            lengths = np.diff(np.asarray(self._locations(), dtype=np.int64))
+            if self._filtered:
+                mask = np.zeros(len(lengths), dtype=bool)
+                mask[list(self._partitions)] = True
+                lengths = lengths[mask]
+            self._pd_length_stats = tuple(lengths.tolist())
         return self._pd_length_stats
 
     def _simplify_up(self, parent, dependents):
@@ -485,7 +513,7 @@ class FromPandas(PartitionsFiltered, BlockwiseIO):
 
     def _filtered_task(self, index: int):
         start, stop = self._locations()[index : index + 2]
-        part = self.frame.iloc[start:stop]
+        part = self.frame._data.iloc[start:stop]
         if self.pyarrow_strings_enabled:
             part = to_pyarrow_string(part)
         if self.operand("columns") is not None:
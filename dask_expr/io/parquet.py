@@ -10,6 +10,7 @@ import warnings
 import weakref
 from abc import abstractmethod
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property, partial
 
 import dask
@@ -22,6 +23,7 @@ import pyarrow.parquet as pq
 import tlz as toolz
 from dask.base import normalize_token, tokenize
 from dask.core import flatten
+from dask.dataframe.io.parquet.arrow import ArrowDatasetEngine
 from dask.dataframe.io.parquet.core import (
     ParquetFunctionWrapper,
     ToParquetFunctionWrapper,
@@ -57,7 +59,7 @@ from dask_expr._expr import (
     determine_column_projection,
 )
 from dask_expr._reductions import Len
-from dask_expr._util import _convert_to_list, _tokenize_deterministic
+from dask_expr._util import LRU, _convert_to_list, _tokenize_deterministic
 from dask_expr.io import BlockwiseIO, PartitionsFiltered
 from dask_expr.io.io import FusedParquetIO
 
@@ -108,6 +110,10 @@ NONE_LABEL = "__null_dask_index__"
 _CACHED_PLAN_SIZE = 10
 _cached_plan = {}
 
+# Dataset info shared by all ``ReadParquet`` expressions reading the same
+# dataset with the same discovery options (see ``ReadParquet._dataset_info``)
+_cached_dataset_info = LRU(_CACHED_PLAN_SIZE)
+
 
 class FragmentWrapper:
     _filesystems = weakref.WeakValueDictionary()
@@ -396,6 +402,7 @@ def to_parquet(
         # Clear read_parquet caches in case we are
         # also reading from the overwritten path
         _cached_plan.clear()
+        _cached_dataset_info.clear()
 
     # Always skip divisions checks if divisions are unknown
     if not df.known_divisions:
@@ -524,6 +531,7 @@ def to_parquet(
     # We do this before returning, even if `compute=False`. This helps ensure
     # that reading files that were just written succeeds.
     fs.invalidate_cache(path)
+    _cached_dataset_info.clear()
 
     return out
 
@@ -575,6 +583,28 @@ def _determine_type_mapper(
         return default_types_mapper
 
 
+# Predicates that can be translated to parquet filters
+_PQ_COMPARISON_TYPES = (LE, GE, LT, GT, EQ, NE)
+_PQ_PREDICATE_TYPES = _PQ_COMPARISON_TYPES + (And, Or)
+
+# Operator of a comparison with swapped sides, e.g. ``5 < x`` -> ``x > 5``
+_FLIPPED_OPERATOR_REPR = {
+    LE: GE._operator_repr,
+    LT: GT._operator_repr,
+    GE: LE._operator_repr,
+    GT: LT._operator_repr,
+    EQ: EQ._operator_repr,
+    NE: NE._operator_repr,
+}
+
+_DATASET_INFO_IGNORED_PARAMETERS = {
+    "columns",
+    "_partitions",
+    "_series",
+    "_dataset_info_cache",
+}
+
+
 class ReadParquet(PartitionsFiltered, BlockwiseIO):
     _pq_length_stats = None
     _absorb_projections = True
@@ -583,10 +613,22 @@ class ReadParquet(PartitionsFiltered, BlockwiseIO):
     def _filter_passthrough_available(self, parent, dependents):
         return (
             super()._filter_passthrough_available(parent, dependents)
-            and (isinstance(parent.predicate, (LE, GE, LT, GT, EQ, NE, And, Or)))
-            and _DNF.extract_pq_filters(self, parent.predicate)._filters is not None
+            and isinstance(parent.predicate, _PQ_PREDICATE_TYPES)
+            and self._extract_pq_filters(parent.predicate)._filters is not None
         )
 
+    @cached_property
+    def _pq_filters_cache(self) -> dict:
+        return {}
+
+    def _extract_pq_filters(self, predicate: Expr) -> _DNF:
+        # Both ``_filter_passthrough_available`` and ``_simplify_up`` need
+        # the filters of the same predicate, so only walk it once
+        key = predicate._name
+        if key not in self._pq_filters_cache:
+            self._pq_filters_cache[key] = _DNF.extract_pq_filters(self, predicate)
+        return self._pq_filters_cache[key]
+
     def _simplify_up(self, parent, dependents):
         if isinstance(parent, Index):
             # Column projection
@@ -605,7 +647,7 @@ class ReadParquet(PartitionsFiltered, BlockwiseIO):
             parent, dependents
         ):
             # Predicate pushdown
-            filters = _DNF.extract_pq_filters(self, parent.predicate)
+            filters = self._extract_pq_filters(parent.predicate)
             if filters._filters is not None:
                 return self.substitute_parameters(
                     {
@@ -621,11 +663,18 @@ class ReadParquet(PartitionsFiltered, BlockwiseIO):
                 return Literal(_lengths)
 
         if isinstance(parent, Len):
-            _lengths = self._get_lengths()
-            if _lengths:
-                return Literal(sum(_lengths))
+            _length = self._get_total_length()
+            if _length is not None:
+                return Literal(_length)
+
+    def _get_total_length(self) -> int | None:
+        """Return the total number of rows using parquet statistics"""
+        _lengths = self._get_lengths()
+        if _lengths:
+            return sum(_lengths)
+        return None
 
-    @property
+    @cached_property
     def columns(self):
         columns_operand = self.operand("columns")
         if columns_operand is None:
@@ -651,6 +700,45 @@ class ReadParquet(PartitionsFiltered, BlockwiseIO):
     def checksum(self):
         return self._dataset_info["checksum"]
 
+    @cached_property
+    def _dataset_info(self):
+        if rv := self.operand("_dataset_info_cache"):
+            return rv
+        listing_token = self._dataset_listing_token
+        if listing_token is not None:
+            # Column selection and partition filtering don't affect
+            # dataset discovery, so all such variants share the result. The
+            # file listing is part of the key to detect modified files.
+            key = _tokenize_deterministic(
+                funcname(type(self)),
+                listing_token,
+                *(
+                    operand
+                    for param, operand in zip(self._parameters, self.operands)
+                    if param not in _DATASET_INFO_IGNORED_PARAMETERS
+                ),
+            )
+            if key not in _cached_dataset_info:
+                _cached_dataset_info[key] = self._collect_dataset_info()
+            dataset_info = _cached_dataset_info[key]
+        else:
+            dataset_info = self._collect_dataset_info()
+        self.operands[type(self)._parameter_index["_dataset_info_cache"]] = dataset_info
+        return dataset_info
+
+    @abstractmethod
+    def _collect_dataset_info(self) -> dict:
+        raise NotImplementedError
+
+    @cached_property
+    def _dataset_listing_token(self) -> str | None:
+        """Token of the files (path, size and modification time)
+
+        Only engines that list the files as part of discovery anyway can
+        provide it cheaply. Without it, the dataset info is not shared.
+        """
+        return None
+
     def _tree_repr_argument_construction(self, i, op, header):
         if self._parameters[i] == "_dataset_info_cache":
             # Don't print this, very ugly
@@ -854,11 +942,7 @@ class ReadParquetPyarrowFS(ReadParquet):
             return tuple(stats["num_rows"] for stats in self.aggregated_statistics)
 
     @cached_property
-    def _dataset_info(self):
-        if rv := self.operand("_dataset_info_cache"):
-            return rv
-        dataset_info = {}
-
+    def _all_files(self):
         path_normalized = self.normalized_path
         # We'll first treat the path as if it was a directory since this is the
         # most common case. Only if this fails, we'll treat it as a file. This
@@ -880,6 +964,15 @@ class ReadParquetPyarrowFS(ReadParquet):
             all_files = [self.fs.get_file_info(path_normalized)]
         # TODO: At this point we could verify if we're dealing with a very
         # inhomogeneous datasets already without reading any further data
+        return all_files
+
+    @cached_property
+    def _dataset_listing_token(self):
+        return tokenize(self._all_files)
+
+    def _collect_dataset_info(self):
+        dataset_info = {}
+        all_files = self._all_files
 
         metadata_file = False
         checksum = None
@@ -901,7 +994,8 @@ class ReadParquetPyarrowFS(ReadParquet):
                 dataset_info["file_sizes"] = [None for fi in _frags]
 
         if checksum is None:
-            checksum = tokenize(all_files)
+            # No file was removed from the listing, so reuse its token
+            checksum = self._dataset_listing_token
             dataset_info["file_sizes"] = [fi.size for fi in all_files]
         dataset_info["checksum"] = checksum
         if dataset is None:
@@ -922,9 +1016,6 @@ class ReadParquetPyarrowFS(ReadParquet):
         dataset_info["dataset"] = dataset
         dataset_info["schema"] = dataset.schema
         dataset_info["base_meta"] = dataset.schema.empty_table().to_pandas()
-        self.operands[
-            type(self)._parameters.index("_dataset_info_cache")
-        ] = dataset_info
         return dataset_info
 
     @cached_property
@@ -1148,10 +1239,7 @@ class ReadParquetFSSpec(ReadParquet):
     def _divisions(self):
         return self._plan["divisions"]
 
-    @property
-    def _dataset_info(self):
-        if rv := self.operand("_dataset_info_cache"):
-            return rv
+    def _collect_dataset_info(self):
         # Process and split user options
         (
             dataset_options,
@@ -1171,15 +1259,9 @@ class ReadParquetFSSpec(ReadParquet):
         read_options["open_file_options"] = open_file_options
         paths = sorted(paths, key=natural_sort_key)  # numeric rather than glob ordering
 
-        auto_index_allowed = False
-        index_operand = self.operand("index")
-        if index_operand is None:
-            # User is allowing auto-detected index
-            auto_index_allowed = True
-        if index_operand and isinstance(index_operand, str):
-            index = [index_operand]
-        else:
-            index = index_operand
+        index = _normalize_index(self.operand("index"))
+        # User is allowing auto-detected index
+        auto_index_allowed = index is None
 
         blocksize = self.blocksize
         if self.split_row_groups in ("infer", "adaptive"):
@@ -1235,8 +1317,7 @@ class ReadParquetFSSpec(ReadParquet):
 
         # Infer meta, accounting for index and columns arguments.
         meta = self.engine._create_dd_meta(dataset_info)
-        index = dataset_info["index"]
-        index = [index] if isinstance(index, str) else index
+        index = _normalize_index(dataset_info["index"])
         meta, index, all_columns = set_index_columns(
             meta, index, None, auto_index_allowed
         )
@@ -1246,10 +1327,6 @@ class ReadParquetFSSpec(ReadParquet):
         dataset_info["index"] = index
         dataset_info["all_columns"] = all_columns
         dataset_info["calculate_divisions"] = self.calculate_divisions
-
-        self.operands[
-            type(self)._parameters.index("_dataset_info_cache")
-        ] = dataset_info
         return dataset_info
 
     def _filtered_task(self, index: int):
@@ -1317,24 +1394,49 @@ class ReadParquetFSSpec(ReadParquet):
         """Return known partition lengths using parquet statistics"""
         if not self.filters:
             self._update_length_statistics()
-            return tuple(
-                length
-                for i, length in enumerate(self._pq_length_stats)
-                if not self._filtered or i in self._partitions
-            )
+            return self._pq_length_stats
         return None
 
+    def _get_total_length(self) -> int | None:
+        if (
+            self.filters
+            or self._filtered
+            or self._pq_length_stats
+            # Only use the plan's statistics if it was built already,
+            # building it is what this shortcut avoids
+            or ("_plan" in self.__dict__ and self._plan["statistics"])
+            or self._dataset_info["has_metadata_file"]
+            # Only the arrow engine exposes the dataset files
+            or not (
+                isinstance(self.engine, type)
+                and issubclass(self.engine, ArrowDatasetEngine)
+            )
+        ):
+            return super()._get_total_length()
+        try:
+            return self._footer_num_rows
+        except (OSError, ValueError):
+            # Unreadable or invalid footers, let the statistics path decide
+            return super()._get_total_length()
+
+    @cached_property
+    def _footer_num_rows(self) -> int:
+        # The total only needs the row count stored in every footer, which
+        # is much cheaper than collecting per-partition statistics
+        return _read_total_num_rows(
+            self._dataset_info["ds"].files, self._dataset_info["fs"]
+        )
+
     def _update_length_statistics(self):
         """Ensure that partition-length statistics are up to date"""
 
         if not self._pq_length_stats:
             if self._plan["statistics"]:
                 # Already have statistics from original API call
-                self._pq_length_stats = tuple(
-                    stat["num-rows"]
-                    for i, stat in enumerate(self._plan["statistics"])
-                    if not self._filtered or i in self._partitions
-                )
+                statistics = self._plan["statistics"]
+                if self._filtered:
+                    statistics = [statistics[i] for i in self._partitions]
+                self._pq_length_stats = tuple(stat["num-rows"] for stat in statistics)
             else:
                 # Need to go back and collect statistics
                 self._pq_length_stats = tuple(
@@ -1364,22 +1466,28 @@ def _set_parquet_engine(engine=None, meta=None):
     return engine
 
 
+def _normalize_index(index):
+    # A single index column may be given as a plain string
+    return [index] if isinstance(index, str) else index
+
+
 def _align_statistics(parts, statistics):
     # Make sure parts and statistics are aligned
     # (if statistics is not empty)
     if statistics and len(parts) != len(statistics):
         statistics = []
     if statistics:
-        result = list(
-            zip(
-                *[
-                    (part, stats)
-                    for part, stats in zip(parts, statistics)
-                    if stats["num-rows"] > 0
-                ]
-            )
+        num_rows = np.fromiter(
+            (stats["num-rows"] for stats in statistics),
+            dtype=np.int64,
+            count=len(statistics),
         )
-        parts, statistics = result or [[], []]
+        mask = num_rows > 0
+        if not mask.all():
+            # Drop empty row groups
+            keep = mask.tolist()
+            parts = list(itertools.compress(parts, keep))
+            statistics = list(itertools.compress(statistics, keep))
     return parts, statistics
 
 
@@ -1505,7 +1613,7 @@ class _DNF:
     @classmethod
     def extract_pq_filters(cls, pq_expr: ReadParquet, predicate_expr: Expr) -> _DNF:
         _filters = None
-        if isinstance(predicate_expr, (LE, GE, LT, GT, EQ, NE)):
+        if isinstance(predicate_expr, _PQ_COMPARISON_TYPES):
             if (
                 not isinstance(predicate_expr.right, Expr)
                 and isinstance(predicate_expr.left, Projection)
@@ -1517,13 +1625,11 @@ class _DNF:
                 _filters = (column, op, value)
             elif (
                 not isinstance(predicate_expr.left, Expr)
-                and isinstance(predicate_expr.left, Projection)
-                and predicate_expr.left.frame._name == pq_expr._name
+                and isinstance(predicate_expr.right, Projection)
+                and predicate_expr.right.frame._name == pq_expr._name
             ):
-                # Simple dict to make sure field comes first in filter
-                flip = {LE: GE, LT: GT, GE: LE, GT: LT}
-                op = predicate_expr
-                op = flip.get(op, op)._operator_repr
+                # Flip the operator to make sure field comes first in filter
+                op = _FLIPPED_OPERATOR_REPR[type(predicate_expr)]
                 column = predicate_expr.right.columns[0]
                 value = predicate_expr.left
                 _filters = (column, op, value)
@@ -1545,6 +1651,24 @@ class _DNF:
 #
 
 
+def _read_total_num_rows(paths, fs):
+    """Sum the number of rows stored in the footers of ``paths``"""
+    if not paths:
+        raise ValueError("No files to read the number of rows from")
+
+    def _num_rows(path):
+        with fs.open(path, default_cache="none") as f:
+            return pq.ParquetFile(f).metadata.num_rows
+
+    if _is_local_fs(fs):
+        return sum(map(_num_rows, paths))
+
+    # Remote footer reads are latency bound, so read them concurrently
+    max_workers = min(len(paths), dask.config.get("num_workers", None) or 16)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return sum(executor.map(_num_rows, paths))
+
+
 def _collect_pq_statistics(
     expr: ReadParquet, columns: list | None = None
 ) -> list[dict] | None:
@@ -1560,11 +1684,9 @@ def _collect_pq_statistics(
 
     # Collect statistics using layer information
     fs = expr._io_func.fs
-    parts = [
-        part
-        for i, part in enumerate(expr._plan["parts"])
-        if not expr._filtered or i in expr._partitions
-    ]
+    parts = expr._plan["parts"]
+    if expr._filtered:
+        parts = [parts[i] for i in expr._partitions]
 
     # Execute with delayed for large and remote datasets
     parallel = int(False if _is_local_fs(fs) else 16)
@@ -1605,6 +1727,15 @@ def _collect_pq_statistics(
 def _read_partition_stats_group(parts, fs, columns=None):
     """Parse the statistics for a group of files"""
 
+    # Parts of the same file share a footer, so only read it once
+    footers = {}
+
+    def _read_footer(path):
+        if path not in footers:
+            with fs.open(path, default_cache="none") as f:
+                footers[path] = pq.ParquetFile(f).metadata
+        return footers[path]
+
     def _read_partition_stats(part, fs, columns=None):
         # Helper function to read Parquet-metadata
         # statistics for a single partition
@@ -1619,8 +1750,7 @@ def _read_partition_stats_group(parts, fs, columns=None):
             piece = p["piece"]
             path = piece[0]
             row_groups = None if piece[1] == [None] else piece[1]
-            with fs.open(path, default_cache="none") as f:
-                md = pq.ParquetFile(f).metadata
+            md = _read_footer(path)
             if row_groups is None:
                 row_groups = list(range(md.num_row_groups))
             for rg in row_groups:
@@ -1,8 +1,11 @@
 import dask
 import pytest
+from dask.dataframe.io.io import sorted_division_locations
 from dask.dataframe.utils import assert_eq
 
 from dask_expr import from_pandas, repartition
+from dask_expr._util import _BackendData
+from dask_expr.io.io import _unique_division_locations
 from dask_expr.tests._util import _backend_library
 
 pd = _backend_library()
@@ -106,6 +109,19 @@ def test_from_pandas_chunksize(pdf, chunksize, npartitions, sort):
     assert_eq(df, pdf, sort_results=sort)
 
 
+@pytest.mark.parametrize("npartitions,chunksize", [(3, None), (7, None), (None, 4)])
+def test_from_pandas_unique_division_locations(npartitions, chunksize):
+    index = pd.date_range("2000-01-01", periods=20)
+    expected = sorted_division_locations(
+        index, npartitions=npartitions, chunksize=chunksize
+    )
+    result = _unique_division_locations(
+        index, npartitions=npartitions, chunksize=chunksize
+    )
+    assert result[0] == list(expected[0])
+    assert result[1] == list(expected[1])
+
+
 def test_from_pandas_npartitions_and_chunksize(pdf):
     with pytest.raises(ValueError, match="npartitions and chunksize"):
         from_pandas(pdf, npartitions=2, chunksize=3)
@@ -127,3 +143,11 @@ def test_from_pandas_string_option():
         assert df.compute().dtypes["y"] == "object"
         assert df.compute().index.dtype == "object"
         assert_eq(df, pdf)
+
+
+def test_backend_data_forwards_attributes(pdf):
+    data = _BackendData(pdf)
+    assert data.shape == pdf.shape
+    assert len(data) == len(pdf)
+    with pytest.raises(AttributeError):
+        data.does_not_exist
@@ -42,6 +42,12 @@ def _make_file(dir, format="parquet", df=None):
     return fn
 
 
+@pytest.fixture(scope="module")
+def parquet_file(tmp_path_factory):
+    # Written once and shared by the read-only tests of this module
+    return _make_file(tmp_path_factory.mktemp("parquet"), format="parquet")
+
+
 def df(fn):
     return read_parquet(fn, columns=["a", "b", "c"])
 
@@ -80,10 +86,10 @@ def df_bc(fn):
         ),
     ],
 )
-def test_simplify(tmpdir, input, expected):
-    fn = _make_file(tmpdir, format="parquet")
+def test_simplify(parquet_file, input, expected):
+    fn = parquet_file
     result = input(fn).simplify()
-    assert str(result.expr) == str(expected(fn).expr)
+    assert result._name == expected(fn)._name
 
 
 @pytest.mark.parametrize("fmt", ["parquet", "csv"])
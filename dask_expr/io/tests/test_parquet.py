@@ -9,11 +9,13 @@ from distributed.utils_test import gen_cluster
 from pyarrow import fs
 
 from dask_expr import from_graph, from_pandas, read_parquet
-from dask_expr._expr import Filter, Lengths, Literal
+from dask_expr._collection import new_collection
+from dask_expr._expr import LT, Filter, Lengths, Literal
 from dask_expr._reductions import Len
 from dask_expr.io import FusedParquetIO, ReadParquet
 from dask_expr.io.parquet import (
     _aggregate_statistics_to_file,
+    _align_statistics,
     _combine_stats,
     _extract_stats,
 )
@@ -27,9 +29,10 @@ def _make_file(dir, df=None):
     return fn
 
 
-@pytest.fixture
-def parquet_file(tmpdir):
-    return _make_file(tmpdir)
+@pytest.fixture(scope="module")
+def parquet_file(tmp_path_factory):
+    # Only ever read, so write it once for the whole module
+    return _make_file(tmp_path_factory.mktemp("parquet"))
 
 
 @pytest.fixture(params=["arrow", "fsspec"])
@@ -58,6 +61,45 @@ def test_parquet_len_filter(tmpdir, filesystem):
         assert rp.operand("columns") == ["c"] or rp.operand("columns") == []
 
 
+def test_parquet_len_from_footers(tmpdir):
+    pdf = pd.DataFrame({"a": range(100)})
+    from_pandas(pdf, npartitions=4).to_parquet(tmpdir)
+    df = read_parquet(tmpdir)
+    assert df.expr._get_total_length() == 100
+    assert "_plan" not in df.expr.__dict__
+    assert len(df) == 100
+    # The total was read from the footers without collecting statistics
+    assert df.expr._pq_length_stats is None
+    assert df.expr._footer_num_rows == 100
+    assert len(df.partitions[1]) == 25
+
+
+@pytest.mark.parametrize("calculate_divisions", [True, False])
+def test_parquet_lengths_of_selected_partitions(tmpdir, calculate_divisions):
+    pdf = pd.DataFrame({"a": range(100)})
+    from_pandas(pdf, npartitions=4).to_parquet(tmpdir)
+    df = read_parquet(tmpdir, calculate_divisions=calculate_divisions)
+    expr = df.expr.substitute_parameters({"_partitions": [1, 3]})
+    assert expr._get_lengths() == (25, 25)
+
+
+def test_dataset_info_shared_between_reads(tmpdir):
+    # Only the arrow filesystem lists the files during discovery, which
+    # makes the listing cheap enough to key the shared info on
+    fn = _make_file(tmpdir)
+    df = read_parquet(fn, filesystem="arrow")
+    df2 = read_parquet(fn, columns=["a"], filesystem="arrow")
+    assert df2.expr._dataset_info is df.expr._dataset_info
+    assert df.expr.checksum == df.expr._dataset_listing_token
+
+    # Rewriting the file invalidates the cached info
+    pdf = pd.DataFrame({"x": range(20)})
+    pdf.to_parquet(fn)
+    df3 = read_parquet(fn, filesystem="arrow")
+    assert df3.expr._dataset_info is not df.expr._dataset_info
+    assert_eq(df3, pdf)
+
+
 @pytest.mark.parametrize("write_metadata_file", [True, False])
 def test_to_parquet(tmpdir, write_metadata_file):
     pdf = pd.DataFrame({"x": [1, 4, 3, 2, 0, 5]})
@@ -211,6 +253,16 @@ def test_predicate_pushdown(tmpdir):
     assert len(y.compute()) == 0
 
 
+def test_predicate_pushdown_flipped_comparison(tmpdir):
+    pdf = pd.DataFrame({"a": range(10), "b": 1})
+    fn = _make_file(tmpdir, df=pdf)
+    df = read_parquet(fn, filesystem="arrow")
+    x = df[new_collection(LT(5, df.a.expr))]
+    y = x.optimize(fuse=False)
+    assert y.expr.operand("filters") == [[("a", ">", 5)]]
+    assert_eq(y, pdf[pdf.a > 5], check_index=False)
+
+
 def test_predicate_pushdown_compound(tmpdir):
     pdf = pd.DataFrame(
         {
@@ -526,3 +578,14 @@ def test_index_only_from_parquet(tmpdir):
     pdf.to_parquet(tmpdir + "/test.parquet")
     result = read_parquet(tmpdir + "/test.parquet").index
     assert_eq(result, pdf.index)
+
+
+def test_align_statistics_drops_empty_row_groups():
+    parts = ["a", "b", "c"]
+    stats = [{"num-rows": 1}, {"num-rows": 0}, {"num-rows": 2}]
+    assert _align_statistics(parts, stats) == (
+        ["a", "c"],
+        [{"num-rows": 1}, {"num-rows": 2}],
+    )
+    assert _align_statistics(parts, stats[:1]) == (parts, [])
+    assert _align_statistics(parts, [{"num-rows": 0}] * 3) == ([], [])
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from itertools import product
 
 import numpy as np
@@ -33,19 +32,19 @@ def test_broadcasting_scalar(pdf, df, op):
     assert_eq(result, pdf + pdf.x.sum())
     assert len(list(result.expr.find_operations(OpAlignPartitions))) == 0
 
-    divisions_lru.data = OrderedDict()
+    divisions_lru.clear()
     result = getattr(df.set_index("x"), op)(df2.x.sum())
     # Make sure that we don't touch divisions
-    assert len(divisions_lru.data) == 0
+    assert len(divisions_lru) == 0
     assert_eq(result, pdf.set_index("x") + pdf.x.sum())
     assert len(list(result.expr.find_operations(OpAlignPartitions))) == 0
 
     if op == "__add__":
         # Can't avoid expensive alignment check, but don't touch divisions while figuring it out
-        divisions_lru.data = OrderedDict()
+        divisions_lru.clear()
         result = getattr(df.set_index("x"), op)(df2.set_index("x").sum())
         # Make sure that we don't touch divisions
-        assert len(divisions_lru.data) == 0
+        assert len(divisions_lru) == 0
         assert_eq(result, pdf.set_index("x") + pdf.set_index("x").sum())
         assert len(list(result.expr.find_operations(OpAlignPartitions))) > 0
 
@@ -61,10 +60,10 @@ def test_broadcasting_scalar(pdf, df, op):
         )
 
     # Can't avoid alignment, but don't touch divisions while figuring it out
-    divisions_lru.data = OrderedDict()
+    divisions_lru.clear()
     result = getattr(df.set_index("x"), op)(df2.set_index("x"))
     # Make sure that we don't touch divisions
-    assert len(divisions_lru.data) == 0
+    assert len(divisions_lru) == 0
     assert_eq(result, pdf.set_index("x") + pdf.set_index("x"))
     assert len(list(result.expr.find_operations(OpAlignPartitions))) > 0
 
@@ -1,7 +1,7 @@
 import pytest
 
 from dask_expr import from_pandas
-from dask_expr._categorical import GetCategories
+from dask_expr._categorical import GetCategories, _categorize_block
 from dask_expr.tests._util import _backend_library, assert_eq
 
 # Set DataFrame backend for this module
@@ -26,6 +26,7 @@ def test_set_categories(pdf):
     assert_eq(df.x.cat.codes, pdf.x.cat.codes)
     ser = df.x.cat.as_unknown()
     assert not ser.cat.known
+    assert_eq(ser, pdf.x, check_categorical=False)
     ser = ser.cat.as_known()
     assert_eq(ser.cat.categories, pd.Index([1, 2, 3, 4]))
     ser = ser.cat.set_categories([1, 2, 3, 5, 4])
@@ -33,6 +34,17 @@ def test_set_categories(pdf):
     assert not ser.cat.ordered
 
 
+def test_as_known_unions_partition_categories():
+    pdf = pd.DataFrame({"x": list("abcdde")})
+    df = from_pandas(pdf, npartitions=3)
+    ser = df.x.astype("category")
+    assert not ser.cat.known
+    ser = ser.cat.as_known()
+    assert ser.cat.known
+    assert list(ser.cat.categories) == ["a", "b", "c", "d", "e"]
+    assert_eq(ser, pdf.x.astype("category"), check_categorical=False)
+
+
 def test_categorize(df, pdf):
     df = df.categorize()
 
@@ -40,6 +52,20 @@ def test_categorize(df, pdf):
     assert_eq(df, pdf.astype({"y": "category"}), check_categorical=False)
 
 
+def test_categorize_block_does_not_mutate_input(pdf):
+    original = pdf.copy()
+    result = _categorize_block(pdf, {"y": ["b", "c"]}, None)
+    assert result.y.dtype == "category"
+    assert_eq(pdf, original)
+
+
+def test_categorize_split_every(pdf):
+    df = from_pandas(pdf, npartitions=6)
+    result = df.categorize(split_every=2)
+    assert result.y.cat.known
+    assert_eq(result, pdf.astype({"y": "category"}), check_categorical=False)
+
+
 def test_get_categories_simplify_adds_projection(df):
     optimized = GetCategories(
         df, columns=["y"], index=False, split_every=None
@@ -14,7 +14,7 @@ import pandas as pd
 import pytest
 from dask.dataframe._compat import PANDAS_GE_210, PANDAS_GE_220
 from dask.dataframe.utils import UNKNOWN_CATEGORIES
-from dask.utils import M
+from dask.utils import M, key_split
 
 from dask_expr import (
     DataFrame,
@@ -210,6 +210,66 @@ def test_dask(pdf, df):
     assert assert_eq(z, (pdf.x + pdf.y).sum())
 
 
+def test_dask_graph_lowered_once(pdf, monkeypatch):
+    from dask_expr._core import Expr
+
+    calls = []
+    lower_completely = Expr.lower_completely
+
+    def counting_lower_completely(self):
+        calls.append(self._name)
+        return lower_completely(self)
+
+    monkeypatch.setattr(Expr, "lower_completely", counting_lower_completely)
+    df = from_pandas(pdf, npartitions=10)
+    assert_eq(df.x.compute(), pdf.x)
+    # Once by ``optimize`` and once for all of the dask protocol methods
+    assert len(calls) == 2
+
+    # Collections held by the user don't keep a lowered expression around
+    assert set(df.__dask_keys__()) <= set(df.__dask_graph__())
+    assert df._lowered is None
+    df.persist()
+    assert df._lowered is None
+
+
+def test_dask_graph_follows_shuffle_config(pdf):
+    from dask.callbacks import Callback
+
+    df = from_pandas(pdf, npartitions=10).shuffle("x")
+    graphs = []
+    with Callback(start=lambda dsk: graphs.append(dsk)):
+        with dask.config.set({"dataframe.shuffle.method": "tasks"}):
+            (tasks_result,) = dask.compute(df, scheduler="sync")
+        with dask.config.set({"dataframe.shuffle.method": "disk"}):
+            (disk_result,) = dask.compute(df, scheduler="sync")
+
+    tasks_graph, disk_graph = graphs
+    assert not any("diskshuffle" in key_split(k) for k in tasks_graph)
+    assert any("diskshuffle" in key_split(k) for k in disk_graph)
+
+    # Standalone protocol calls follow the current config as well
+    with dask.config.set({"dataframe.shuffle.method": "tasks"}):
+        tasks_keys = df.__dask_keys__()
+        df.__dask_graph__()
+    with dask.config.set({"dataframe.shuffle.method": "disk"}):
+        disk_keys = df.__dask_keys__()
+    assert set(tasks_keys) <= set(tasks_graph)
+    assert set(disk_keys) <= set(disk_graph)
+    assert disk_keys != tasks_keys
+    assert_eq(tasks_result, pdf, check_index=False, sort_results=True)
+    assert_eq(disk_result, pdf, check_index=False, sort_results=True)
+
+
+def test_lower_shared_subexpressions(pdf, df):
+    # Shared sub-expressions are lowered once, not once per path
+    x, expected = df.x, pdf.x
+    for _ in range(40):
+        x, expected = x + x, expected + expected
+    assert x.expr.lower_completely()._name == x.expr.lower_completely()._name
+    assert_eq(x, expected)
+
+
 @pytest.mark.parametrize("func", ["cumsum", "cumprod", "cummin", "cummax"])
 def test_cumulative_methods(df, pdf, func):
     assert_eq(getattr(df, func)(), getattr(pdf, func)(), check_dtype=False)
@@ -1000,7 +1060,7 @@ def test_combine_first_simplify(pdf):
 def test_rename_traverse_filter(df):
     result = df.rename(columns={"x": "xx"})[["xx"]].simplify()
     expected = df[["x"]].simplify().rename(columns={"x": "xx"})
-    assert str(result) == str(expected)
+    assert result._name == expected._name
 
 
 def test_columns_traverse_filters(pdf):
@@ -1040,7 +1100,7 @@ def test_drop_duplicates_subset_simplify(pdf, subset, projection):
     result = df.drop_duplicates(subset=subset)[projection].simplify()
     expected = df[["x", "zz"]].simplify().drop_duplicates(subset=subset)[projection]
 
-    assert str(result) == str(expected)
+    assert result._name == expected._name
 
 
 def test_rename_columns():
@@ -1266,6 +1326,13 @@ def test_substitute():
     expected = df["b"].sum() + 6
     assert result._name == expected._name
 
+    # Shared sub-expressions are rewritten once, not once per path
+    a, b = df["a"], df["b"]
+    for _ in range(40):
+        a, b = a + a, b + b
+    result = a.substitute(df["a"], df["b"])
+    assert result._name == b._name
+
 
 def test_substitute_parameters(df):
     pdf = pd.DataFrame(
@@ -1328,6 +1395,10 @@ def test_partitions(pdf, df):
     assert_eq(df.partitions[1:3], pdf.iloc[10:30])
     assert_eq(df.partitions[[3, 4]], pdf.iloc[30:50])
     assert_eq(df.partitions[-1], pdf.iloc[90:])
+    assert_eq(df.partitions[[1, -1]], pd.concat([pdf.iloc[10:20], pdf.iloc[90:]]))
+    assert_eq(df.partitions[::5], pd.concat([pdf.iloc[:10], pdf.iloc[50:60]]))
+    with pytest.raises(IndexError):
+        df.partitions[10]
 
     out = (df + 1).partitions[0].simplify()
     assert isinstance(out.expr, expr.Add)
@@ -1592,6 +1663,11 @@ def test_depth(df):
     assert (df + 1)._depth() == 2
     assert ((df.x + 1) + df.y)._depth() == 4
 
+    cache = {}
+    x = df.x + 1
+    assert (x + x)._depth(cache) == 4
+    assert cache[x._name] == 3
+
 
 def test_partitions_nested(df):
     a = expr.Partitions(expr.Partitions(df.expr, [2, 4, 6]), [0, 2])
@@ -8,14 +8,14 @@ from dask_expr.tests._util import _backend_library, assert_eq
 pd = _backend_library()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pdf():
     pdf = pd.DataFrame({"x": range(100)})
     pdf["y"] = pdf.x * 10.0
     yield pdf
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def df(pdf):
     yield from_pandas(pdf, npartitions=10)
 
@@ -332,6 +332,7 @@ def test_concat5():
 
 
 def test_concat_series(pdf):
+    pdf = pdf.copy()
     pdf["z"] = 1
     df = from_pandas(pdf, npartitions=5)
     q = concat([df.y, df.x, df.z], axis=1)[["x", "y"]]
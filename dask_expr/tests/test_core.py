@@ -17,3 +17,27 @@ def test_endless_simplify():
     expr = ExprA()
     with pytest.raises(RuntimeError, match="converge"):
         expr.simplify()
+
+
+class ExprC(Expr):
+    _parameters = ["x", "y", "z"]
+
+    @property
+    def z(self):
+        return "property"
+
+
+class ExprD(ExprC):
+    _parameters = ["y", "x"]
+
+
+def test_operand_attributes():
+    expr = ExprC(1, 2, 3)
+    assert (expr.x, expr.y) == (1, 2)
+    # Methods and properties take precedence over operands
+    assert expr.z == "property"
+    assert expr.operand("z") == 3
+
+    # Accessors follow the parameter order of the subclass
+    expr = ExprD(1, 2)
+    assert (expr.x, expr.y) == (2, 1)
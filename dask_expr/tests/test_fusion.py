@@ -98,6 +98,16 @@ def test_optimize_fusion_broadcast(df):
     assert len(fused.dask) < len(result.dask)
 
 
+def test_fused_dependencies_are_unique(df, pdf):
+    s = df["x"].sum()
+    result = (df["x"] + s) * (df["x"] - s)
+    fused = optimize(result)
+
+    names = [dep._name for dep in fused.expr.dependencies()]
+    assert len(names) == len(set(names)) == 2
+    assert_eq(fused, (pdf["x"] + pdf["x"].sum()) * (pdf["x"] - pdf["x"].sum()))
+
+
 def test_persist_with_fusion(df):
     # Check that fusion works after persisting
     df = (df + 2).persist()
@@ -1,5 +1,4 @@
 import re
-from collections import OrderedDict
 
 import dask
 import numpy as np
@@ -16,13 +15,13 @@ from dask_expr.tests._util import _backend_library, assert_eq, xfail_gpu
 pd = _backend_library()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pdf():
     pdf = pd.DataFrame({"x": list(range(10)) * 10, "y": range(100), "z": 1})
     yield pdf
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def df(pdf):
     yield from_pandas(pdf, npartitions=4)
 
@@ -367,9 +366,9 @@ def test_split_out_automatically():
 
 
 def test_split_out_sort_values_compute(pdf, df):
-    divisions_lru.data = OrderedDict()
+    divisions_lru.clear()
     result = df.groupby("x").sum(split_out=2).sort_values(by="y").compute()
-    assert len(divisions_lru.data) == 0
+    assert len(divisions_lru) == 0
     expected = pdf.groupby("x").sum().sort_values(by="y")
     assert_eq(result, expected)
 
@@ -643,6 +642,7 @@ def test_groupby_apply_args(df, pdf):
 
 
 def test_groupby_ffill_bfill(pdf):
+    pdf = pdf.copy()
     pdf["y"] = pdf["y"].astype("float64")
 
     pdf.iloc[np.arange(0, len(pdf) - 1, 3), 1] = np.nan
@@ -792,6 +792,7 @@ def test_groupby_udf_user_warning(df, pdf):
 
 
 def test_groupby_index_array(pdf):
+    pdf = pdf.copy()
     pdf.index = pd.date_range(start="2020-12-31", freq="D", periods=len(pdf))
     df = from_pandas(pdf, npartitions=10)
 
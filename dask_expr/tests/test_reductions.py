@@ -13,14 +13,14 @@ from dask_expr.tests._util import _backend_library, assert_eq, xfail_gpu
 pd = _backend_library()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pdf():
     pdf = pd.DataFrame({"x": range(100)})
     pdf["y"] = pdf.x // 7  # Not unique; duplicates span different partitions
     yield pdf
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def df(pdf):
     yield from_pandas(pdf, npartitions=10)
 
@@ -45,6 +45,7 @@ def test_median(pdf, df):
 
 
 def test_min_dt(pdf):
+    pdf = pdf.copy()
     pdf["dt"] = "a"
     df = from_pandas(pdf, npartitions=10)
     assert_eq(df.min(numeric_only=True), pdf.min(numeric_only=True))
@@ -291,6 +292,18 @@ def test_reductions(func, pdf, df):
     assert_eq(result, func(pdf, axis=1))
 
 
+@pytest.mark.parametrize("func", [M.sum, M.prod, M.min, M.max])
+def test_reductions_keep_float32(func, pdf):
+    # The partition kernels must not upcast to float64
+    pdf = pdf.astype("float32")
+    df = from_pandas(pdf, npartitions=10)
+    result = func(df.y)
+    assert result.dtype == "float32"
+    assert result.compute().dtype == "float32"
+    assert_eq(result, func(pdf.y))
+    assert_eq(func(df), func(pdf))
+
+
 def test_skew_kurt():
     pdf = pd.DataFrame(
         {
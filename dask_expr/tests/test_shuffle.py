@@ -1,5 +1,3 @@
-from collections import OrderedDict
-
 import dask
 import numpy as np
 import pytest
@@ -451,7 +449,7 @@ def test_sort_tail_nsmallest(df, pdf):
 )
 @pytest.mark.parametrize("npartitions", [1, 3])
 def test_sort_values_conflicting_ascending_head_tail(pdf, ascending, npartitions):
-    divisions_lru.data = OrderedDict()
+    divisions_lru.clear()
 
     df = from_pandas(pdf, npartitions=npartitions)
 
@@ -622,7 +620,7 @@ def test_set_index_sorted_divisions(df):
 
 
 def test_set_index_sort_values_one_partition(pdf):
-    divisions_lru.data = OrderedDict()
+    divisions_lru.clear()
     df = from_pandas(pdf, sort=False)
     query = df.sort_values("x").optimize(fuse=False)
     assert query.divisions == (0, 99)
@@ -644,11 +642,11 @@ def test_set_index_sort_values_one_partition(pdf):
 
 
 def test_set_index_triggers_calc_when_accessing_divisions(pdf, df):
-    divisions_lru.data = OrderedDict()
+    divisions_lru.clear()
     query = df.set_index("x")
-    assert len(divisions_lru.data) == 0
+    assert len(divisions_lru) == 0
     divisions = query.divisions  # noqa: F841
-    assert len(divisions_lru.data) == 1
+    assert len(divisions_lru) == 1
 
 
 def test_shuffle(df, pdf):